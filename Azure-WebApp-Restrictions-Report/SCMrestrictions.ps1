@@ -36,21 +36,14 @@ class SiteRestrictions {
     [Object]$ScmSiteRestrictions
 }
 
-$allSitesRestrictions = @()
-
-# Get List of Web Apps
-$webAppsUri = "https://management.azure.com/subscriptions/$subscriptionId/providers/Microsoft.Web/sites?api-version=$APIVersion"
+# Get List of Web Apps in the target resource group
+$webAppsUri = "https://management.azure.com/subscriptions/$subscriptionId/resourceGroups/$targetResourceGroupName/providers/Microsoft.Web/sites?api-version=$APIVersion"
 $webAppsResponse = Invoke-RestMethod -Uri $webAppsUri -Headers $headers
 $webApps = $webAppsResponse.value
 
-foreach ($webApp in $webApps) {
+$allSitesRestrictions = foreach ($webApp in $webApps) {
     $WebAppName = $webApp.name
     $WebAppRGName = $webApp.id.Split('/')[4]
- 
-    # Skip if the web app is not in the desired resource group
-    if ($WebAppRGName -ne $targetResourceGroupName) {
-        continue
-    }
 
     # REST API call to get Main Site IP and SCM IP restrictions
     $mainSiteIpRestrictionsUri = "https://management.azure.com/subscriptions/$subscriptionId/resourceGroups/$WebAppRGName/providers/Microsoft.Web/sites/$WebAppName/config/web?api-version=$APIVersion"
@@ -65,8 +58,8 @@ foreach ($webApp in $webApps) {
     $siteRestrictions.MainSiteRestrictions = $mainSiteIpRestrictions
     $siteRestrictions.ScmSiteRestrictions = $scmIpSecurityRestrictions
 
-    # Add to the array
-    $allSitesRestrictions += $siteRestrictions
+    # Emit to the collected results
+    $siteRestrictions
 }
 
 # Output the results
@@ -37,9 +37,7 @@ $SqlLocations = Get-AzLocation |
 # get subscription quota and regional available SLOs for Sql SQL
  
 Write-Host "Getting subscription quota settings for Sql..."
-$quotaResults = [System.Collections.ObjectModel.Collection[psobject]]@()
-
-foreach($location in $SqlLocations)
+$quotaResults = foreach($location in $SqlLocations)
 {
     # ------------------
     # available slos
@@ -55,7 +53,7 @@ foreach($location in $SqlLocations)
     
     # ------------------------------------
  
-    $quotaResults += [PSCustomObject]@{
+    [PSCustomObject]@{
         Location = $location.Location;
         DisplayName = $location.DisplayName;
         CurrentSqlServerCount = $currentQuotaResult.currentValue;